@@ -1,5 +1,17 @@
 import re
 import logging
+from types import MappingProxyType
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Single dispatcher for derivative prefixes: either the slash form
+# 'd2/dx2 f' (groups 1-3) or the digit form 'd2x f' (groups 4-5), with
+# the function part in group 6. Digitless prefixes like 'dx f' are left
+# to the shortcut table, matching the old startswith gating.
+_DERIV_RE = re.compile(r'^d(?:(\d*)/d([xyzt])(\d*)|(\d+)([xyzt]))\s+(.+)$')
 
 class ExpressionShortcuts:
     """
@@ -157,46 +169,105 @@ class ExpressionShortcuts:
         'sim': r'\sim',
     }
     
+    # Merged view of every shortcut category, built once at class definition
+    # time so convert_shortcut does not rebuild it on every keystroke.
+    # Stored longest key first so any iteration order (regex alternation,
+    # automaton tie-breaking) prefers 'arcsin' over 'sin' by construction
+    # rather than by accident of category insertion order. Wrapped in a
+    # read-only proxy because get_all_shortcuts used to hand out a fresh
+    # dict per call and callers must not mutate the shared one.
+    ALL_SHORTCUTS = MappingProxyType(dict(sorted(
+        {
+            **DERIVATIVE_SHORTCUTS,
+            **COMBINATORIAL_SHORTCUTS,
+            **INTEGRAL_SHORTCUTS,
+            **FUNCTION_SHORTCUTS,
+            **FRACTION_SHORTCUTS,
+            **GREEK_SHORTCUTS,
+            **OPERATOR_SHORTCUTS,
+            **EQUATION_SHORTCUTS,
+        }.items(),
+        key=lambda item: -len(item[0])
+    )))
+
+    # Shortcuts whose replacement contains '#' are templates that need their
+    # arguments filled in elsewhere, so they are kept out of the blind
+    # text substitution below.
+    _PLAIN_SHORTCUTS = {k: v for k, v in ALL_SHORTCUTS.items() if '#' not in v}
+
+    # Single alternation over every plain shortcut, compiled once here
+    # instead of being rebuilt on every convert_shortcut call. Inherits
+    # the longest-key-first ordering of ALL_SHORTCUTS.
+    _SHORTCUT_RE = re.compile('|'.join(map(re.escape, _PLAIN_SHORTCUTS)))
+
+    # Characters any shortcut can start with, plus 'C' for the infix nCr
+    # combinatorial form. Used as a cheap prefilter: an input containing
+    # none of these cannot be changed by any conversion below.
+    _SHORTCUT_FIRST_CHARS = frozenset(k[0] for k in ALL_SHORTCUTS) | {'C'}
+
+    # Aho-Corasick automaton over the same keys, built lazily on first use
+    # when pyahocorasick is available. One pass over the input finds every
+    # shortcut at once instead of the regex engine retrying alternatives.
+    _SHORTCUT_AUTOMATON = None
+
+    @classmethod
+    def _substitute_shortcuts(cls, text):
+        """Replace every plain shortcut in text, longest match winning."""
+        if ahocorasick is None:
+            return cls._SHORTCUT_RE.sub(lambda m: cls._PLAIN_SHORTCUTS[m.group()], text)
+
+        if cls._SHORTCUT_AUTOMATON is None:
+            automaton = ahocorasick.Automaton()
+            for key, value in cls._PLAIN_SHORTCUTS.items():
+                automaton.add_word(key, (key, value))
+            automaton.make_automaton()
+            cls._SHORTCUT_AUTOMATON = automaton
+
+        matches = []
+        for end, (key, value) in cls._SHORTCUT_AUTOMATON.iter(text):
+            start = end - len(key) + 1
+            matches.append((start, -len(key), key, value))
+
+        if not matches:
+            return text
+
+        # Leftmost match first, longest key winning on ties, overlapping
+        # shorter matches inside an already consumed span dropped.
+        matches.sort()
+        pieces = []
+        pos = 0
+        for start, _, key, value in matches:
+            if start < pos:
+                continue
+            pieces.append(text[pos:start])
+            pieces.append(value)
+            pos = start + len(key)
+        pieces.append(text[pos:])
+        return ''.join(pieces)
+
     @classmethod
     def get_all_shortcuts(cls):
-        all_shortcuts = {}
-        all_shortcuts.update(cls.DERIVATIVE_SHORTCUTS)
-        all_shortcuts.update(cls.COMBINATORIAL_SHORTCUTS)
-        all_shortcuts.update(cls.INTEGRAL_SHORTCUTS)
-        all_shortcuts.update(cls.FUNCTION_SHORTCUTS)
-        all_shortcuts.update(cls.FRACTION_SHORTCUTS)
-        all_shortcuts.update(cls.GREEK_SHORTCUTS)
-        all_shortcuts.update(cls.OPERATOR_SHORTCUTS)
-        all_shortcuts.update(cls.EQUATION_SHORTCUTS)
-        return all_shortcuts
+        return cls.ALL_SHORTCUTS
     
     @classmethod
     def convert_shortcut(cls, text):
         result = text
         
-        if text.startswith('d') and ('/' in text or text[1:2].isdigit()):
-            parts = text.split(' ', 1)
-            if len(parts) == 2:
-                derivative_part, function_part = parts
-                
-                if '/' in derivative_part:
-                    order_match = re.match(r'd(\d*)/d([xyzt])(\d*)', derivative_part)
-                    if order_match:
-                        order = order_match.group(1) or '1'
-                        var = order_match.group(2)
-                        power = order_match.group(3) or order  # Use same number for denominator power
-                        return f"\\frac{{d^{order}}}{{d{var}^{power}}} {function_part}"
-                else:
-                    order_match = re.match(r'd(\d*)([xyzt])', derivative_part)
-                    if order_match:
-                        order = order_match.group(1) or '1'
-                        var = order_match.group(2)
-                        return f"\\frac{{d^{order}}}{{d{var}^{order}}} {function_part}"
-                    order_match = re.match(r'd(\d*)([xyz])', derivative_part)
-                    if order_match:
-                        order = order_match.group(1) or '1'
-                        var = order_match.group(2)
-                        return f"\\frac{{d^{order}}}{{d{var}^{order}}} {function_part}"
+        order_match = _DERIV_RE.match(text)
+        if order_match:
+            if order_match.group(2):
+                order = order_match.group(1) or '1'
+                var = order_match.group(2)
+                power = order_match.group(3) or order  # Use same number for denominator power
+            else:
+                order = power = order_match.group(4)
+                var = order_match.group(5)
+            return f"\\frac{{d^{order}}}{{d{var}^{power}}} {order_match.group(6)}"
+
+        # Most plain inputs ('1+2', 'x^2') contain no shortcut keyword at
+        # all; reject them with one C-level scan before the conversions.
+        if not cls._SHORTCUT_FIRST_CHARS.intersection(text):
+            return result
 
         result = cls.convert_exponential_expression(result)
         result = cls.convert_integral_expression(result)
@@ -205,12 +276,8 @@ class ExpressionShortcuts:
         result = cls.convert_combinatorial_expression(result)
         result = cls.convert_sum_prod_expression(result)
         
-        shortcuts = {k: v for k, v in cls.get_all_shortcuts().items() if '#' not in v}
-        
-        if shortcuts:
-            pattern = '|'.join(map(re.escape, sorted(shortcuts.keys(), key=len, reverse=True)))
-            result = re.sub(pattern, lambda m: shortcuts[m.group()], result)
-        
+        result = cls._substitute_shortcuts(result)
+
         return result.replace('\\', '')
     
     @classmethod
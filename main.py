@@ -182,6 +182,64 @@ def parse_latex_expression(latex_expr):
     logger.debug(f"Final MATLAB expression: '{latex_expr}'")
     return latex_expr
 
+# Handlers for special function names in _handle_function, keyed on the
+# SymPy func name. Built once at import time instead of per call; each
+# handler takes the converted argument list and whether the calculator is
+# in Degree mode.
+_FUNCTION_HANDLERS = {
+    'sin': lambda args, degrees: f"sind({args[0]})" if degrees else f"sin({args[0]})",
+    'cos': lambda args, degrees: f"cosd({args[0]})" if degrees else f"cos({args[0]})",
+    'tan': lambda args, degrees: f"tand({args[0]})" if degrees else f"tan({args[0]})",
+    'csc': lambda args, degrees: f"csc({args[0]})",
+    'sec': lambda args, degrees: f"sec({args[0]})",
+    'cot': lambda args, degrees: f"cot({args[0]})",
+
+    'asin': lambda args, degrees: f"asind({args[0]})" if degrees else f"asin({args[0]})",
+    'arcsin': lambda args, degrees: f"asind({args[0]})" if degrees else f"asin({args[0]})",
+    'acos': lambda args, degrees: f"acosd({args[0]})" if degrees else f"acos({args[0]})",
+    'arccos': lambda args, degrees: f"acosd({args[0]})" if degrees else f"acos({args[0]})",
+    'atan': lambda args, degrees: f"atand({args[0]})" if degrees else f"atan({args[0]})",
+    'arctan': lambda args, degrees: f"atand({args[0]})" if degrees else f"atan({args[0]})",
+
+    'sinh': lambda args, degrees: f"sinh({args[0]})",
+    'cosh': lambda args, degrees: f"cosh({args[0]})",
+    'tanh': lambda args, degrees: f"tanh({args[0]})",
+    'csch': lambda args, degrees: f"csch({args[0]})",
+    'sech': lambda args, degrees: f"sech({args[0]})",
+    'coth': lambda args, degrees: f"coth({args[0]})",
+
+    'asinh': lambda args, degrees: f"asinh({args[0]})",
+    'arcsinh': lambda args, degrees: f"asinh({args[0]})",
+    'acosh': lambda args, degrees: f"acosh({args[0]})",
+    'arccosh': lambda args, degrees: f"acosh({args[0]})",
+    'atanh': lambda args, degrees: f"atanh({args[0]})",
+    'arctanh': lambda args, degrees: f"atanh({args[0]})",
+
+    'log': lambda args, degrees: f"log({args[0]})",
+    'sqrt': lambda args, degrees: f"sqrt({args[0]})",
+    'Abs': lambda args, degrees: f"abs({args[0]})",
+    'factorial': lambda args, degrees: f"factorial({args[0]})",
+    'nchoosek': lambda args, degrees: f"nchoosek({args[0]}, {args[1]})",
+    'symsum': lambda args, degrees: f"symsum({args[0]}, {args[1]}, {args[2]}, {args[3]})",
+    'prod': lambda args, degrees: f"prod({args[0]}, {args[1]}, {args[2]}, {args[3]})"
+}
+
+# SymPy-to-MATLAB token rewrites used by _apply_function_replacements.
+# Applied as one pass of a single compiled alternation (longest key first)
+# instead of one full str.replace scan per entry.
+_FUNCTION_REPLACEMENTS = {
+    'ln': 'log', 'log10': 'log10', 'log2': 'log2',
+    'sin': 'sin', 'cos': 'cos', 'tan': 'tan',
+    'asin': 'asin', 'acos': 'acos', 'atan': 'atan',
+    'log': 'log', 'exp': 'exp', 'sqrt': 'sqrt',
+    'factorial': 'factorial', '**': '^', 'pi': 'pi',
+    'E': 'exp(1)', 'Abs': 'abs', 'Derivative': 'diff'
+}
+
+_FUNCTION_REPL_RE = re.compile(
+    '|'.join(map(re.escape, sorted(_FUNCTION_REPLACEMENTS, key=len, reverse=True)))
+)
+
 class CalculatorApp(QWidget, LatexCalculation):
     """
     Main calculator application window with support for LaTeX, MATLAB, and Matrix operations.
@@ -209,6 +267,9 @@ class CalculatorApp(QWidget, LatexCalculation):
         
         self.logger = logger
         self.logger.info("Initializing Calculator Application")
+        # Cached so hot conversion paths can skip formatting debug
+        # f-strings (which stringify whole SymPy trees) when debug is off.
+        self._debug = self.logger.isEnabledFor(logging.DEBUG)
         
         self.theme_manager = ThemeManager()
         self.legend_window = None
@@ -248,6 +309,18 @@ class CalculatorApp(QWidget, LatexCalculation):
 
         # DEPRECATED: Will be removed in future version
         self.sympy_converter = SympyToMatlab()
+        # Memoizes converted SymPy expressions so shared subtrees are only
+        # walked once; cleared at the start of every calculate() call.
+        self._sympy_cache = {}
+        # Structured expression types resolved with a single dict lookup
+        # along the type's MRO instead of an isinstance cascade; anything
+        # not matched falls through to the generic converter.
+        self._dispatch = {
+            sy.Integral: self._handle_integral,
+            sy.Derivative: self._handle_derivative,
+            sy.core.relational.Relational: self._handle_equation,
+            sy.Function: self._handle_function,
+        }
         self.current_log_type = None
         self.visualizer = MathVisualizer()
         
@@ -376,15 +449,37 @@ class CalculatorApp(QWidget, LatexCalculation):
         if ok and name:
             self.matrix_input.setPlainText(self.matrix_memory[name])
     
-    def sympy_to_matlab(self, expr):
+    def _fast_convert(self, expr):
+        """Cache lookup plus type dispatch without the error-logging
+        wrapper of sympy_to_matlab; used on the recursion hot path."""
         try:
+            cached = self._sympy_cache.get(expr)
+        except TypeError:
+            # Unhashable input (e.g. a list); convert without caching.
             return self.sympy_converter.sympy_to_matlab(expr)
+        if cached is not None:
+            return cached
+
+        for cls in type(expr).__mro__:
+            handler = self._dispatch.get(cls)
+            if handler is not None:
+                result = handler(expr)
+                break
+        else:
+            result = self.sympy_converter.sympy_to_matlab(expr)
+        self._sympy_cache[expr] = result
+        return result
+
+    def sympy_to_matlab(self, expr):
+        try:
+            return self._fast_convert(expr)
         except Exception as e:
             self.logger.error(f"Error in sympy_to_matlab conversion: {e}", exc_info=True)
             raise
 
     def _handle_list_expression(self, expr):
-        self.logger.debug(f"Handling list expression: {expr}")
+        if self._debug:
+            self.logger.debug(f"Handling list expression: {expr}")
         try:
             if isinstance(expr, list):
                 if not expr:
@@ -397,28 +492,33 @@ class CalculatorApp(QWidget, LatexCalculation):
             raise
 
     def _handle_integral(self, expr):
-        self.logger.debug(f"Handling integral expression: {expr}")
+        if self._debug:
+            self.logger.debug(f"Handling integral expression: {expr}")
         try:
-            func = self.sympy_to_matlab(expr.function)
+            func = self._fast_convert(expr.function)
             var = expr.variables[0]
-            
-            self.logger.debug(f"Integral function: {func}, variable: {var}")
-            
+
+            if self._debug:
+                self.logger.debug(f"Integral function: {func}, variable: {var}")
+
             func = self._convert_logarithms(func)
-            
+
             if len(expr.limits) == 0:
                 result = f"int({func}, {var})"
-                self.logger.debug(f"Created indefinite integral: {result}")
+                if self._debug:
+                    self.logger.debug(f"Created indefinite integral: {result}")
                 return result
-            
+
             if len(expr.limits) == 1:
                 if len(expr.limits[0]) == 3:
                     a, b = expr.limits[0][1], expr.limits[0][2]
                     result = f"int({func}, {var}, {a}, {b})"
-                    self.logger.debug(f"Created definite integral: {result}")
+                    if self._debug:
+                        self.logger.debug(f"Created definite integral: {result}")
                     return result
                 result = f"int({func}, {var})"
-                self.logger.debug(f"Created integral with variable: {result}")
+                if self._debug:
+                    self.logger.debug(f"Created integral with variable: {result}")
                 return result
             
             self.logger.error("Unsupported integral type encountered")
@@ -429,10 +529,11 @@ class CalculatorApp(QWidget, LatexCalculation):
             raise
 
     def _handle_derivative(self, expr):
-        self.logger.debug(f"Handling derivative expression: {expr}")
+        if self._debug:
+            self.logger.debug(f"Handling derivative expression: {expr}")
         try:
-            func = self.sympy_to_matlab(expr.expr)
-            
+            func = self._fast_convert(expr.expr)
+
             var = str(expr.variables[0])
             
             if hasattr(expr, 'order'):
@@ -446,8 +547,9 @@ class CalculatorApp(QWidget, LatexCalculation):
                 result = f"diff({func}, {var}, {order})"
             else:
                 result = f"diff({func}, {var})"
-            
-            self.logger.debug(f"Created derivative expression: {result}")
+
+            if self._debug:
+                self.logger.debug(f"Created derivative expression: {result}")
             return result
             
         except Exception as e:
@@ -455,7 +557,8 @@ class CalculatorApp(QWidget, LatexCalculation):
             raise
 
     def _process_derivative_variables(self, variables):
-        self.logger.debug(f"Processing derivative variables: {variables}")
+        if self._debug:
+            self.logger.debug(f"Processing derivative variables: {variables}")
         try:
             matlab_vars = []
             last_var = None
@@ -472,8 +575,9 @@ class CalculatorApp(QWidget, LatexCalculation):
                     
             if last_var is not None:
                 matlab_vars.append(f"{str(last_var)}, {order}" if order > 1 else str(last_var))
-                
-            self.logger.debug(f"Processed variables: {matlab_vars}")
+
+            if self._debug:
+                self.logger.debug(f"Processed variables: {matlab_vars}")
             return matlab_vars
             
         except Exception as e:
@@ -481,10 +585,11 @@ class CalculatorApp(QWidget, LatexCalculation):
             raise
 
     def _handle_equation(self, expr):
-        self.logger.debug(f"Handling equation/inequality expression: {expr}")
+        if self._debug:
+            self.logger.debug(f"Handling equation/inequality expression: {expr}")
         try:
-            lhs = self.sympy_to_matlab(expr.lhs)
-            rhs = self.sympy_to_matlab(expr.rhs)
+            lhs = self._fast_convert(expr.lhs)
+            rhs = self._fast_convert(expr.rhs)
             
             # Determine the operator from the expression
             if isinstance(expr, sy.core.relational.GreaterThan):
@@ -499,7 +604,8 @@ class CalculatorApp(QWidget, LatexCalculation):
                 operator = "=="
             
             result = f"{lhs} {operator} {rhs}"
-            self.logger.debug(f"Created equation/inequality: {result}")
+            if self._debug:
+                self.logger.debug(f"Created equation/inequality: {result}")
             return result
             
         except Exception as e:
@@ -507,56 +613,23 @@ class CalculatorApp(QWidget, LatexCalculation):
             raise
 
     def _handle_function(self, expr):
-        self.logger.debug(f"Handling function expression: {expr}")
+        if self._debug:
+            self.logger.debug(f"Handling function expression: {expr}")
         try:
             func_name = expr.func.__name__
-            args = [self.sympy_to_matlab(arg) for arg in expr.args]
-            
-            function_handlers = {
-                'sin': lambda args: f"sind({args[0]})" if self.combo_angle.currentText() == 'Degree' else f"sin({args[0]})",
-                'cos': lambda args: f"cosd({args[0]})" if self.combo_angle.currentText() == 'Degree' else f"cos({args[0]})",
-                'tan': lambda args: f"tand({args[0]})" if self.combo_angle.currentText() == 'Degree' else f"tan({args[0]})",
-                'csc': lambda args: f"csc({args[0]})",
-                'sec': lambda args: f"sec({args[0]})",
-                'cot': lambda args: f"cot({args[0]})",
-                
-                'asin': lambda args: f"asind({args[0]})" if self.combo_angle.currentText() == 'Degree' else f"asin({args[0]})",
-                'arcsin': lambda args: f"asind({args[0]})" if self.combo_angle.currentText() == 'Degree' else f"asin({args[0]})",
-                'acos': lambda args: f"acosd({args[0]})" if self.combo_angle.currentText() == 'Degree' else f"acos({args[0]})",
-                'arccos': lambda args: f"acosd({args[0]})" if self.combo_angle.currentText() == 'Degree' else f"acos({args[0]})",
-                'atan': lambda args: f"atand({args[0]})" if self.combo_angle.currentText() == 'Degree' else f"atan({args[0]})",
-                'arctan': lambda args: f"atand({args[0]})" if self.combo_angle.currentText() == 'Degree' else f"atan({args[0]})",
-                
-                'sinh': lambda args: f"sinh({args[0]})",
-                'cosh': lambda args: f"cosh({args[0]})",
-                'tanh': lambda args: f"tanh({args[0]})",
-                'csch': lambda args: f"csch({args[0]})",
-                'sech': lambda args: f"sech({args[0]})",
-                'coth': lambda args: f"coth({args[0]})",
-                
-                'asinh': lambda args: f"asinh({args[0]})",
-                'arcsinh': lambda args: f"asinh({args[0]})",
-                'acosh': lambda args: f"acosh({args[0]})",
-                'arccosh': lambda args: f"acosh({args[0]})",
-                'atanh': lambda args: f"atanh({args[0]})",
-                'arctanh': lambda args: f"atanh({args[0]})",
-                
-                'log': lambda args: f"log({args[0]})",
-                'sqrt': lambda args: f"sqrt({args[0]})",
-                'Abs': lambda args: f"abs({args[0]})",
-                'factorial': lambda args: f"factorial({args[0]})",
-                'nchoosek': lambda args: f"nchoosek({args[0]}, {args[1]})",
-                'symsum': lambda args: f"symsum({args[0]}, {args[1]}, {args[2]}, {args[3]})",
-                'prod': lambda args: f"prod({args[0]}, {args[1]}, {args[2]}, {args[3]})"
-            }
-            
-            if func_name in function_handlers:
-                result = function_handlers[func_name](args)
-                self.logger.debug(f"Handled special function {func_name}: {result}")
+            args = [self._fast_convert(arg) for arg in expr.args]
+            degrees = self.combo_angle.currentText() == 'Degree'
+
+            handler = _FUNCTION_HANDLERS.get(func_name)
+            if handler is not None:
+                result = handler(args, degrees)
+                if self._debug:
+                    self.logger.debug(f"Handled special function {func_name}: {result}")
                 return result
-            
+
             result = f"{func_name}({', '.join(args)})"
-            self.logger.debug(f"Handled generic function {func_name}: {result}")
+            if self._debug:
+                self.logger.debug(f"Handled generic function {func_name}: {result}")
             return result
             
         except Exception as e:
@@ -584,18 +657,9 @@ class CalculatorApp(QWidget, LatexCalculation):
         return expr_str
 
     def _apply_function_replacements(self, expr_str):
-        replacements = {
-            'ln': 'log', 'log10': 'log10', 'log2': 'log2',
-            'sin': 'sin', 'cos': 'cos', 'tan': 'tan',
-            'asin': 'asin', 'acos': 'acos', 'atan': 'atan',
-            'log': 'log', 'exp': 'exp', 'sqrt': 'sqrt',
-            'factorial': 'factorial', '**': '^', 'pi': 'pi',
-            'E': 'exp(1)', 'Abs': 'abs', 'Derivative': 'diff'
-        }
-        
-        for sympy_func, matlab_func in replacements.items():
-            expr_str = expr_str.replace(sympy_func, matlab_func)
-        return expr_str
+        return _FUNCTION_REPL_RE.sub(
+            lambda m: _FUNCTION_REPLACEMENTS[m.group()], expr_str
+        )
 
     def _handle_integral_derivative_patterns(self, expr_str):
         patterns = {
@@ -628,6 +692,7 @@ class CalculatorApp(QWidget, LatexCalculation):
 
     def calculate(self):
         try:
+            self._sympy_cache.clear()
             mode = self.combo_mode.currentText()
             angle_mode = self.combo_angle.currentText()
             
@@ -2,16 +2,51 @@ from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
     QLineEdit, QPushButton, QMessageBox, QSlider
 )
-from PyQt5.QtCore import Qt, QUrl
+from PyQt5.QtCore import Qt, QUrl, QThread, pyqtSignal
 from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent
 from PyQt5.QtMultimediaWidgets import QVideoWidget
 from manim_visual.manim_visualizer import MathVisualizer
 from manim import *
+from ast import literal_eval
+from collections import OrderedDict
 import logging
 import os
 import shutil
 
+class _RenderThread(QThread):
+    """Runs a Manim scene render off the UI thread.
+
+    Rendering is CPU and IO heavy and would otherwise freeze the window
+    for seconds; the result (or failure) is signalled back so the UI
+    thread can load the video into the media player.
+    """
+    finished_render = pyqtSignal(str)
+    failed = pyqtSignal(str)
+
+    def __init__(self, scene, video_path, parent=None):
+        super().__init__(parent)
+        self._scene = scene
+        self._video_path = video_path
+
+    def run(self):
+        try:
+            self._scene.render()
+            if os.path.exists(self._video_path):
+                self.finished_render.emit(self._video_path)
+            else:
+                self.failed.emit(f"Video file not found at {self._video_path}")
+        except Exception as e:
+            self.failed.emit(str(e))
+
 class VisualizationWindow(QMainWindow):
+    # Rendered videos kept per (expression, x_range, y_range) key so
+    # replotting unchanged inputs reuses the mp4 instead of re-rendering.
+    _RENDER_CACHE_SIZE = 8
+
+    # Intermediate render artifacts pruned after each render; deliberately
+    # excludes .mp4 so cached videos survive.
+    _INTERMEDIATE_EXTS = frozenset({'.svg', '.tex', '.aux', '.log', '.dvi', '.xdv', '.png'})
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.logger = logging.getLogger(__name__)
@@ -28,9 +63,12 @@ class VisualizationWindow(QMainWindow):
         self.media_player.durationChanged.connect(self.duration_changed)
         
         self.visualizer = MathVisualizer()
-        
+        self._render_cache = OrderedDict()
+        self._render_thread = None
+        self._pending_cache_key = None
+
         self._init_ui()
-        
+
         self._cleanup_manim_files()
 
     def _init_ui(self):
@@ -83,6 +121,7 @@ class VisualizationWindow(QMainWindow):
     def _cleanup_manim_files(self):
         """Clean up all files in the media directory."""
         try:
+            self._render_cache.clear()
             media_dir = os.path.join(os.getcwd(), "media")
             if os.path.exists(media_dir):
                 shutil.rmtree(media_dir, ignore_errors=True)
@@ -128,17 +167,29 @@ class VisualizationWindow(QMainWindow):
         self.media_player.play()
         self.play_button.setText("Pause")
 
+    def _parse_range(self, text):
+        """Parse a range input like '(-10, 10)' into a validated 2-tuple."""
+        value = literal_eval(text.strip())
+        if (not isinstance(value, (tuple, list)) or len(value) != 2
+                or not all(isinstance(v, (int, float)) for v in value)):
+            raise ValueError(f"Range must be a pair of numbers, got: {text!r}")
+        return tuple(value)
+
     def update_plot(self):
         """Update the plot based on user input."""
         try:
             if self.current_function:
                 self.media_player.stop()
                 self.media_player.setMedia(QMediaContent())
-                self._cleanup_manim_files()
-                
-                x_range = eval(self.x_range_input.text())
-                y_range = eval(self.y_range_input.text())
-                self.visualize_function(self.current_function, x_range, y_range)
+
+                x_range = self._parse_range(self.x_range_input.text())
+                y_range = self._parse_range(self.y_range_input.text())
+                self.visualize_function(
+                    self.current_function,
+                    self.current_python_expr,
+                    x_range=x_range,
+                    y_range=y_range
+                )
             else:
                 QMessageBox.warning(self, "Error", "No function to visualize.")
         except Exception as e:
@@ -148,54 +199,125 @@ class VisualizationWindow(QMainWindow):
     def visualize_function(self, func_str: str, python_expr: str = None, x_range: tuple = (-10, 10), y_range: tuple = (-5, 5)):
         """Visualize a function using MathVisualizer."""
         try:
+            if self._render_thread is not None and self._render_thread.isRunning():
+                self.logger.info("Render already in progress, ignoring request")
+                return
+
             self.media_player.stop()
             self.media_player.setMedia(QMediaContent())
-            
-            self._cleanup_manim_files()
-            
+
             self.current_function = func_str
             self.current_python_expr = python_expr if python_expr else func_str
             self.function_input.setText(func_str)
             self.x_range_input.setText(str(x_range))
             self.y_range_input.setText(str(y_range))
-            
+
+            cache_key = (self.current_python_expr, x_range, y_range)
+            cached_path = self._render_cache.get(cache_key)
+            if cached_path is not None and os.path.exists(cached_path):
+                self._render_cache.move_to_end(cache_key)
+                self.logger.debug(f"Reusing cached render for {cache_key}")
+                self._play_video(cached_path)
+                return
+
             media_dir = os.path.join(os.getcwd(), "media")
             video_dir = os.path.join(media_dir, "videos", "1080p60")
             os.makedirs(video_dir, exist_ok=True)
-            
+
             config.media_dir = media_dir
             config.video_dir = video_dir
-            
+
             scene = self.visualizer.FunctionScene(
                 self.current_python_expr,
-                x_range=x_range, 
-                y_range=y_range, 
+                x_range=x_range,
+                y_range=y_range,
                 display_text=self.current_function,
                 logger=self.logger
             )
-            scene.render()
-            
+
             video_path = os.path.join(video_dir, "FunctionScene.mp4")
-            
-            if os.path.exists(video_path):
-                self.media_player.setMedia(
-                    QMediaContent(QUrl.fromLocalFile(os.path.abspath(video_path)))
-                )
-                self.play_button.setEnabled(True)
-                self.replay_button.setEnabled(True)
-                
-                self.media_player.mediaStatusChanged.connect(self._handle_media_status)
-                
-                self.media_player.play()
-                self.play_button.setText("Pause")
-            else:
-                self.logger.error(f"Video file not found at {video_path}")
-                QMessageBox.critical(self, "Error", "Video file not found")
-                
+
+            # Render off the UI thread; _on_render_finished picks the
+            # video up once the worker signals completion.
+            self._pending_cache_key = cache_key
+            self._render_thread = _RenderThread(scene, video_path, self)
+            self._render_thread.finished_render.connect(self._on_render_finished)
+            self._render_thread.failed.connect(self._on_render_failed)
+            self.update_button.setEnabled(False)
+            self._render_thread.start()
+
         except Exception as e:
             self.logger.error(f"Error in visualization: {e}")
             QMessageBox.critical(self, "Error", f"Failed to visualize function: {str(e)}")
 
+    def _on_render_finished(self, video_path):
+        """Load a finished background render into the media player."""
+        self.update_button.setEnabled(True)
+        try:
+            video_path = self._cache_rendered_video(self._pending_cache_key, video_path)
+            self._prune_render_artifacts(os.path.join(os.getcwd(), "media"))
+            self._play_video(video_path)
+        except Exception as e:
+            self.logger.error(f"Error in visualization: {e}")
+            QMessageBox.critical(self, "Error", f"Failed to visualize function: {str(e)}")
+
+    def _on_render_failed(self, message):
+        """Report a failed background render."""
+        self.update_button.setEnabled(True)
+        self.logger.error(f"Error in visualization: {message}")
+        QMessageBox.critical(self, "Error", f"Failed to visualize function: {message}")
+
+    def _cache_rendered_video(self, cache_key, video_path):
+        """Copy a fresh render to a key-unique file and cache its path,
+        evicting the oldest cached video past the cap."""
+        cached_path = os.path.join(
+            os.path.dirname(video_path),
+            f"FunctionScene_{abs(hash(cache_key)):x}.mp4"
+        )
+        shutil.copyfile(video_path, cached_path)
+        self._render_cache[cache_key] = cached_path
+        if len(self._render_cache) > self._RENDER_CACHE_SIZE:
+            _, old_path = self._render_cache.popitem(last=False)
+            try:
+                os.remove(old_path)
+            except OSError:
+                pass
+        return cached_path
+
+    def _prune_render_artifacts(self, media_dir):
+        """Delete Manim's intermediate TeX/image artifacts after a render.
+
+        Uses os.scandir recursion with a frozenset extension check, so
+        directories with many leftover files are swept in one cheap pass
+        while the cached videos are left in place.
+        """
+        def _iter(path):
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        yield from _iter(entry.path)
+                    elif os.path.splitext(entry.name)[1] in self._INTERMEDIATE_EXTS:
+                        yield entry.path
+
+        try:
+            for file_path in _iter(media_dir):
+                os.remove(file_path)
+        except OSError as e:
+            self.logger.debug(f"Skipping artifact pruning: {e}")
+
+    def _play_video(self, video_path):
+        """Load a rendered video into the media player and start playback."""
+        self.media_player.setMedia(
+            QMediaContent(QUrl.fromLocalFile(os.path.abspath(video_path)))
+        )
+        self.play_button.setEnabled(True)
+        self.replay_button.setEnabled(True)
+
+        self.media_player.mediaStatusChanged.connect(self._handle_media_status)
+
+        self.media_player.play()
+        self.play_button.setText("Pause")
+
     def _handle_media_status(self, status):
         """Handle media status changes."""
         if status == QMediaPlayer.EndOfMedia:
@@ -208,11 +330,14 @@ class VisualizationWindow(QMainWindow):
     def closeEvent(self, event):
         """Handle window close event."""
         try:
+            if self._render_thread is not None and self._render_thread.isRunning():
+                self._render_thread.wait()
+
             self.media_player.stop()
             self.media_player.setMedia(QMediaContent())
-            
+
             self._cleanup_manim_files()
-            
+
             event.accept()
             
             if hasattr(self.parent(), 'viz_window'):